@@ -12,42 +12,38 @@ Didaktische Ziele:
 from __future__ import annotations
 
 import csv
+import io
 import ipaddress
+import itertools
 import math
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Iterable, Iterator, TextIO
 
 
 class UI:
-    def __init__(self, use_color: bool = True) -> None:
+    H = "1;36"
+    OK = "1;32"
+    WRN = "1;33"
+    ERR = "1;31"
+    DIM = "2"
+
+    def __init__(self, use_color: bool = True, parallel: bool = False) -> None:
         self.use_color = use_color and sys.stdout.isatty()
+        self.parallel = parallel
+        self.c = self._c_color if self.use_color else self._c_plain
 
-    def c(self, text: str, code: str) -> str:
-        if not self.use_color:
-            return text
+    @staticmethod
+    def _c_color(text: str, code: str) -> str:
         return f"\033[{code}m{text}\033[0m"
 
-    @property
-    def H(self) -> str:
-        return "1;36"
-
-    @property
-    def OK(self) -> str:
-        return "1;32"
-
-    @property
-    def WRN(self) -> str:
-        return "1;33"
-
-    @property
-    def ERR(self) -> str:
-        return "1;31"
-
-    @property
-    def DIM(self) -> str:
-        return "2"
+    @staticmethod
+    def _c_plain(text: str, code: str) -> str:
+        return text
 
     def headline(self, text: str) -> None:
         print(self.c(f"\n{text}", self.H))
@@ -71,30 +67,110 @@ class UI:
             self.info(f"   {line}")
 
 
-@dataclass(frozen=True)
 class SubnetInfo:
-    subnet: str
-    netmask: str
-    wildcard: str
-    network: str
-    broadcast: str
-    first_host: str
-    last_host: str
-    usable_hosts: int
-    total_addresses: int
-    borrowed_bits: int
-    host_bits: int
-    magic_number: int
-    interesting_octet: int
-    mask_octet_value: int
+    """Ein IPv4-Subnetz als Integer; Texte werden erst beim Zugriff formatiert."""
 
+    __slots__ = ("net_int", "bcast_int", "prefix", "borrowed_bits")
 
-def mask_from_prefix(prefix: int) -> str:
-    return str(ipaddress.IPv4Network(f"0.0.0.0/{prefix}").netmask)
+    def __init__(self, net_int: int, prefix: int, borrowed_bits: int = 0) -> None:
+        self.net_int = net_int
+        self.bcast_int = net_int | (_PREFIX_TABLE[prefix][5] ^ 0xFFFFFFFF)
+        self.prefix = prefix
+        self.borrowed_bits = borrowed_bits
+
+    def __repr__(self) -> str:
+        return f"SubnetInfo({self.subnet!r}, borrowed_bits={self.borrowed_bits})"
 
+    @property
+    def subnet(self) -> str:
+        return f"{int_to_ip(self.net_int)}/{self.prefix}"
 
-def wildcard_from_mask(mask: str) -> str:
-    return ".".join(str(255 - int(o)) for o in mask.split("."))
+    @property
+    def netmask(self) -> str:
+        return _PREFIX_TABLE[self.prefix][0]
+
+    @property
+    def wildcard(self) -> str:
+        return _PREFIX_TABLE[self.prefix][1]
+
+    @property
+    def network(self) -> str:
+        return int_to_ip(self.net_int)
+
+    @property
+    def broadcast(self) -> str:
+        return int_to_ip(self.bcast_int)
+
+    @property
+    def first_host(self) -> str:
+        return int_to_ip(self.net_int + _HOST_TABLE[self.prefix][3])
+
+    @property
+    def last_host(self) -> str:
+        return int_to_ip(self.bcast_int - _HOST_TABLE[self.prefix][3])
+
+    @property
+    def usable_hosts(self) -> int:
+        return _HOST_TABLE[self.prefix][1]
+
+    @property
+    def total_addresses(self) -> int:
+        return _HOST_TABLE[self.prefix][0]
+
+    @property
+    def host_bits(self) -> int:
+        return _HOST_TABLE[self.prefix][2]
+
+    @property
+    def magic_number(self) -> int:
+        return _PREFIX_TABLE[self.prefix][2]
+
+    @property
+    def interesting_octet(self) -> int:
+        return _PREFIX_TABLE[self.prefix][3]
+
+    @property
+    def mask_octet_value(self) -> int:
+        return _PREFIX_TABLE[self.prefix][4]
+
+
+_OCTET = tuple(str(i) for i in range(256))
+
+
+def int_to_ip(value: int) -> str:
+    return (
+        f"{_OCTET[(value >> 24) & 0xFF]}.{_OCTET[(value >> 16) & 0xFF]}."
+        f"{_OCTET[(value >> 8) & 0xFF]}.{_OCTET[value & 0xFF]}"
+    )
+
+
+def wildcard_from_mask_int(mask_int: int) -> str:
+    return int_to_ip(mask_int ^ 0xFFFFFFFF)
+
+
+def _prefix_entry(prefix: int) -> tuple[str, str, int, int, int, int]:
+    mask_int = (0xFFFFFFFF << (32 - prefix)) & 0xFFFFFFFF
+    if prefix == 0:
+        magic, oct_no, mask_oct = 256, 1, 0
+    elif prefix % 8 == 0:
+        magic, oct_no, mask_oct = 1, prefix // 8, 255
+    else:
+        idx = prefix // 8
+        mask_oct = (mask_int >> (24 - 8 * idx)) & 0xFF
+        magic, oct_no = 256 - mask_oct, idx + 1
+    return int_to_ip(mask_int), wildcard_from_mask_int(mask_int), magic, oct_no, mask_oct, mask_int
+
+
+# Präfix (0..32) -> (Maske, Wildcard, Magic Number, Oktett-Nr., Maskenwert, Maske als int)
+_PREFIX_TABLE = tuple(_prefix_entry(p) for p in range(33))
+
+
+def mask_int_from_prefix(prefix: int) -> int:
+    return _PREFIX_TABLE[prefix][5]
+
+
+def mask_from_prefix(prefix: int) -> str:
+    return _PREFIX_TABLE[prefix][0]
 
 
 def to_binary(octets: tuple[int, ...]) -> str:
@@ -110,76 +186,62 @@ def mask_to_binary(mask: str) -> str:
 
 
 def block_size(prefix: int) -> int:
-    return 2 ** (32 - prefix)
+    return _HOST_TABLE[prefix][0]
 
 
 def interesting_octet(prefix: int) -> tuple[int, int, int]:
-    netmask = ipaddress.IPv4Network(f"0.0.0.0/{prefix}").netmask
-    octets = list(map(int, str(netmask).split(".")))
-    if prefix == 0:
-        return 256, 1, 0
-    if prefix % 8 == 0:
-        return 1, prefix // 8, 255
-    idx = prefix // 8
-    mask_oct = octets[idx]
-    magic = 256 - mask_oct
-    return magic, idx + 1, mask_oct
+    return _PREFIX_TABLE[prefix][2:5]
 
 
-def calc_host_capacity(prefix: int) -> tuple[int, int, int]:
-    total = 2 ** (32 - prefix)
+def _host_entry(prefix: int) -> tuple[int, int, int, int]:
+    total = 1 << (32 - prefix)
     if prefix <= 30:
-        return total, max(total - 2, 0), 32 - prefix
+        return total, total - 2, 32 - prefix, 1
     if prefix == 31:
-        return total, 2, 1
-    return total, 1, 0
+        return total, 2, 1, 0
+    return total, 1, 0, 0
+
+
+# Präfix (0..32) -> (Gesamtadressen, nutzbare Hosts, Host-Bits, Abstand erster/letzter Host zu Netz/Broadcast)
+_HOST_TABLE = tuple(_host_entry(p) for p in range(33))
+
+
+def calc_host_capacity(prefix: int) -> tuple[int, int, int]:
+    return _HOST_TABLE[prefix][:3]
+
+
+def describe_subnet_from_ints(net_int: int, prefix: int, borrowed_bits: int = 0) -> SubnetInfo:
+    return SubnetInfo(net_int, prefix, borrowed_bits)
 
 
 def describe_subnet(net: ipaddress.IPv4Network, borrowed_bits: int = 0) -> SubnetInfo:
-    total, usable, host_bits = calc_host_capacity(net.prefixlen)
-    netmask = str(net.netmask)
-    wildcard = wildcard_from_mask(netmask)
-    magic, oct_no, mask_oct = interesting_octet(net.prefixlen)
-
-    if net.prefixlen <= 30:
-        first = str(net.network_address + 1)
-        last = str(net.broadcast_address - 1)
-    elif net.prefixlen == 31:
-        first = str(net.network_address)
-        last = str(net.broadcast_address)
-    else:
-        first = str(net.network_address)
-        last = str(net.network_address)
-
-    return SubnetInfo(
-        subnet=str(net),
-        netmask=netmask,
-        wildcard=wildcard,
-        network=str(net.network_address),
-        broadcast=str(net.broadcast_address),
-        first_host=first,
-        last_host=last,
-        usable_hosts=usable,
-        total_addresses=total,
-        borrowed_bits=borrowed_bits,
-        host_bits=host_bits,
-        magic_number=magic,
-        interesting_octet=oct_no,
-        mask_octet_value=mask_oct,
-    )
+    return describe_subnet_from_ints(int(net.network_address), net.prefixlen, borrowed_bits)
+
+
+def _enumerate_subnet_ints(base_int: int, base_prefix: int, new_prefix: int) -> Iterator[int]:
+    block = 1 << (32 - new_prefix)
+    start = base_int & mask_int_from_prefix(base_prefix)
+    return iter(range(start, start + (1 << (new_prefix - base_prefix)) * block, block))
+
 
+def describe_subnets_bulk(
+    base_int: int, base_prefix: int, new_prefix: int, borrowed_bits: int = 0
+) -> Iterator[SubnetInfo]:
+    for net_int in _enumerate_subnet_ints(base_int, base_prefix, new_prefix):
+        yield describe_subnet_from_ints(net_int, new_prefix, borrowed_bits)
 
-def subnet_by_count(net: ipaddress.IPv4Network, n: int) -> tuple[int, list[ipaddress.IPv4Network], int]:
+
+def subnet_by_count(net: ipaddress.IPv4Network, n: int) -> tuple[int, Iterator[ipaddress.IPv4Network], int]:
     if n <= 0:
         raise ValueError("N muss >= 1 sein.")
-    borrowed_bits = math.ceil(math.log2(n)) if n > 1 else 0
+    borrowed_bits = (n - 1).bit_length()
     new_prefix = net.prefixlen + borrowed_bits
     if new_prefix > 32:
         raise ValueError("Zu viele Subnetze: Präfix würde > /32 werden.")
-    return new_prefix, list(net.subnets(new_prefix=new_prefix)), borrowed_bits
+    return new_prefix, net.subnets(new_prefix=new_prefix), borrowed_bits
 
 
-def subnet_by_hosts(net: ipaddress.IPv4Network, hosts: int) -> tuple[int, list[ipaddress.IPv4Network], int]:
+def subnet_by_hosts(net: ipaddress.IPv4Network, hosts: int) -> tuple[int, Iterator[ipaddress.IPv4Network], int]:
     if hosts <= 0:
         raise ValueError("Hosts müssen >= 1 sein.")
 
@@ -190,13 +252,13 @@ def subnet_by_hosts(net: ipaddress.IPv4Network, hosts: int) -> tuple[int, list[i
         host_bits = 1
         new_prefix = 31
     else:
-        host_bits = math.ceil(math.log2(hosts + 2))
+        host_bits = (hosts + 1).bit_length()
         new_prefix = 32 - host_bits
 
     if new_prefix < net.prefixlen:
         raise ValueError("Nicht möglich: gewünschte Hostanzahl passt nicht in das Ausgangsnetz.")
 
-    return new_prefix, list(net.subnets(new_prefix=new_prefix)), host_bits
+    return new_prefix, net.subnets(new_prefix=new_prefix), host_bits
 
 
 def ask_int(ui: UI, prompt: str, min_v: int = 1, max_v: int | None = None) -> int | None:
@@ -223,7 +285,7 @@ def ask_int(ui: UI, prompt: str, min_v: int = 1, max_v: int | None = None) -> in
             ui.error("Ungültige Zahl. Beispiel: 8 (oder 'b' für Zurück)")
 
 
-def ask_net(ui: UI, prompt: str) -> ipaddress.IPv4Network | None:
+def ask_net(ui: UI, prompt: str) -> tuple[ipaddress.IPv4Network, int] | None:
     while True:
         raw = input(prompt).strip()
 
@@ -241,29 +303,31 @@ def ask_net(ui: UI, prompt: str) -> ipaddress.IPv4Network | None:
             )
             continue
 
+        if ":" in raw:
+            ui.error("Bitte nur IPv4 (z.B. 192.168.1.0/24).")
+            continue
+
         try:
-            net = ipaddress.ip_network(raw, strict=False)
-            if not isinstance(net, ipaddress.IPv4Network):
-                ui.error("Bitte nur IPv4 (z.B. 192.168.1.0/24).")
-                continue
-            return net
+            net = ipaddress.IPv4Network(raw, strict=False)
+            return net, int(net.network_address)
         except ValueError:
             ui.error("Ungültiges Format. Beispiel: 192.168.1.0/24 (oder 'b' für Zurück)")
 
 
-def ask_ip(ui: UI, prompt: str) -> ipaddress.IPv4Address | None:
+def ask_ip(ui: UI, prompt: str) -> tuple[ipaddress.IPv4Address, int] | None:
     while True:
         raw = input(prompt).strip()
 
         if raw.lower() in ("b", "back", "q", "quit", ""):
             return None
 
+        if ":" in raw:
+            ui.error("Bitte nur IPv4 (z.B. 192.168.1.10).")
+            continue
+
         try:
-            ip = ipaddress.ip_address(raw)
-            if not isinstance(ip, ipaddress.IPv4Address):
-                ui.error("Bitte nur IPv4 (z.B. 192.168.1.10).")
-                continue
-            return ip
+            ip = ipaddress.IPv4Address(raw)
+            return ip, int(ip)
         except ValueError:
             ui.error("Ungültige IPv4-Adresse. Beispiel: 10.0.0.5 (oder 'b' für Zurück)")
 
@@ -417,12 +481,11 @@ def action_ipv6_subnet(ui: UI) -> None:
     )
 
     ui.info("\nErste 20 Subnetze:")
-    subs = list(base.subnets(new_prefix=new_prefix))
-    for i, s in enumerate(subs[:20], 1):
+    for i, s in enumerate(itertools.islice(base.subnets(new_prefix=new_prefix), 20), 1):
         ui.info(f"  {i:>2}. {s}")
 
-    if len(subs) > 20:
-        ui.warn(f"  ... und {len(subs) - 20} weitere (zu viele für Anzeige)")
+    if num_subnets > 20:
+        ui.warn(f"  ... und {num_subnets - 20} weitere (zu viele für Anzeige)")
 
 
 import random
@@ -576,9 +639,10 @@ def action_vlsm(ui: UI) -> None:
         ],
     )
 
-    base = ask_net(ui, "Ausgangsnetz (z.B. 192.168.1.0/24): ")
-    if base is None:
+    parsed = ask_net(ui, "Ausgangsnetz (z.B. 192.168.1.0/24): ")
+    if parsed is None:
         return
+    base, _ = parsed
 
     ui.info("\nGib Subnetze ein (Name + Hosts).Leerzeile beendet.")
     ui.info("Beispiel: Server 50")
@@ -627,7 +691,7 @@ def action_vlsm(ui: UI) -> None:
     current = base.network_address
 
     for name, hosts_needed in subnets_input:
-        host_bits = math.ceil(math.log2(hosts_needed + 2))
+        host_bits = (hosts_needed + 1).bit_length()
         prefix = 32 - host_bits
         total_addr = 2 ** host_bits
         usable = total_addr - 2 if prefix < 31 else (2 if prefix == 31 else 1)
@@ -675,12 +739,11 @@ def print_tutor_intro(ui: UI) -> None:
 
 def print_summary(ui: UI, base: ipaddress.IPv4Network, new_prefix: int, borrowed_bits: int = 0) -> None:
     total, usable, host_bits = calc_host_capacity(new_prefix)
-    mask = mask_from_prefix(new_prefix)
-    magic, oct_no, mask_oct = interesting_octet(new_prefix)
+    mask, wildcard, magic, oct_no, mask_oct, _ = _PREFIX_TABLE[new_prefix]
 
     ui.info(f"Ausgangsnetz : {base}")
     ui.info(f"Neue Maske   : {mask}  (/{new_prefix})")
-    ui.info(f"Wildcard     : {wildcard_from_mask(mask)}")
+    ui.info(f"Wildcard     : {wildcard}")
     ui.info(f"Host Bits    : {host_bits}")
     ui.info(f"Borrowed Bits: {borrowed_bits}")
     ui.info(f"Blockgröße   : {block_size(new_prefix)} Adressen pro Subnetz")
@@ -707,20 +770,31 @@ def print_summary(ui: UI, base: ipaddress.IPv4Network, new_prefix: int, borrowed
     )
 
 
-def print_subnets(ui: UI, infos: list[SubnetInfo], limit: int | None = None) -> None:
-    show = infos if limit is None else infos[:limit]
+def print_subnets(
+    ui: UI, infos: Iterable[SubnetInfo], limit: int | None = None, total: int | None = None
+) -> None:
+    show = infos if limit is None else itertools.islice(infos, limit)
+    if ui.use_color:
+        head_on, head_off = f"\033[{ui.H}m", "\033[0m"
+    else:
+        head_on = head_off = ""
+
+    buf: list[str] = []
     for i, info in enumerate(show, 1):
-        ui.info(ui.c(f"{i:>2}. {info.subnet}", ui.H))
-        ui.info(f"    Netzwerk   : {info.network}")
-        ui.info(f"    Broadcast  : {info.broadcast}")
-        ui.info(f"    Hostrange  : {info.first_host}  –  {info.last_host}")
-        ui.info(f"    Hosts      : {info.usable_hosts} (gesamt {info.total_addresses})")
-        ui.info(f"    Maske      : {info.netmask}   Wildcard: {info.wildcard}")
-        ui.info(f"    Magic      : {info.magic_number} (Oktett {info.interesting_octet})")
-        ui.info("")
+        buf.append(
+            f"{head_on}{i:>2}. {info.subnet}{head_off}\n"
+            f"    Netzwerk   : {info.network}\n"
+            f"    Broadcast  : {info.broadcast}\n"
+            f"    Hostrange  : {info.first_host}  –  {info.last_host}\n"
+            f"    Hosts      : {info.usable_hosts} (gesamt {info.total_addresses})\n"
+            f"    Maske      : {info.netmask}   Wildcard: {info.wildcard}\n"
+            f"    Magic      : {info.magic_number} (Oktett {info.interesting_octet})\n"
+            "\n"
+        )
+    sys.stdout.write("".join(buf))
 
-    if limit is not None and len(infos) > limit:
-        ui.warn(f"(Anzeige gekürzt: {limit} von {len(infos)} Subnetzen. Export enthält alle.)")
+    if limit is not None and total is not None and total > limit:
+        ui.warn(f"(Anzeige gekürzt: {limit} von {total} Subnetzen. Export enthält alle.)")
 
 
 def print_exam_tips(ui: UI) -> None:
@@ -801,57 +875,147 @@ def print_classful_context(ui: UI, net: ipaddress.IPv4Network) -> None:
     print_tricks(ui, net.prefixlen)
 
 
+EXPORT_BUFFER_SIZE = 1 << 20
+PARALLEL_EXPORT_MIN = 100_000
+EXPORT_CHUNK_SIZE = 1 << 16
+
+_MD_ROW = "| `{0}` | `{1}` | `{2}` | `{3}` | `{4}` | {5} | {6} | `{7}` | `{8}` | {9} |\n".format
+
+CSV_HEADER = [
+    "Subnetz", "Netzwerk", "Broadcast", "Erster Host", "Letzter Host", "Nutzbare Hosts",
+    "Gesamtadressen", "Maske", "Wildcard", "Magic Number", "Interessantes Oktett", "Host Bits", "Borrowed Bits"
+]
+
+
+def _export_paths(mode_name: str, out_dir: Path | None) -> tuple[Path, Path]:
+    out_dir = out_dir or Path.home() / "Downloads"
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return out_dir / f"subnet_{mode_name}_{ts}.md", out_dir / f"subnet_{mode_name}_{ts}.csv"
+
+
+def _md_header(base: ipaddress.IPv4Network, mode_name: str) -> str:
+    return (
+        f"# Subnetting-Export ({mode_name})\n"
+        "\n"
+        f"- Datum/Zeit: {datetime.now().isoformat(timespec='seconds')}\n"
+        f"- Ausgangsnetz: `{base}`\n"
+        "\n"
+        "## Didaktische Kurz-Zusammenfassung\n"
+        "- Vorgehen: Ziel klären -> Präfix berechnen -> Magic Number -> Subnetze prüfen.\n"
+        "- Prüfen: Netzwerkadresse, Broadcast, Hostbereich und nutzbare Hosts.\n"
+        "\n"
+        "| Subnetz | Netz | Broadcast | First Host | Last Host | Nutzbare Hosts | Gesamtadressen | Maske | Wildcard | Magic |\n"
+        "|---|---|---|---|---|---:|---:|---|---|---:|\n"
+    )
+
+
+def _write_md_rows(f: TextIO, infos: Iterable[SubnetInfo]) -> None:
+    f.writelines(
+        _MD_ROW(
+            x.subnet, x.network, x.broadcast, x.first_host, x.last_host,
+            x.usable_hosts, x.total_addresses, x.netmask, x.wildcard, x.magic_number,
+        )
+        for x in infos
+    )
+
+
+def _write_csv_rows(f: TextIO, infos: Iterable[SubnetInfo]) -> None:
+    csv.writer(f, delimiter=";").writerows(
+        (
+            x.subnet, x.network, x.broadcast, x.first_host, x.last_host, x.usable_hosts,
+            x.total_addresses, x.netmask, x.wildcard, x.magic_number, x.interesting_octet, x.host_bits, x.borrowed_bits
+        )
+        for x in infos
+    )
+
+
 def export_markdown_and_csv(
     ui: UI,
     base: ipaddress.IPv4Network,
     mode_name: str,
-    infos: list[SubnetInfo],
+    infos: Iterable[SubnetInfo],
     out_dir: Path | None = None,
 ) -> tuple[Path, Path]:
-    out_dir = out_dir or Path.home() / "Downloads"
-    out_dir.mkdir(parents=True, exist_ok=True)
+    md_path, csv_path = _export_paths(mode_name, out_dir)
+    infos = iter(infos)
 
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    md_path = out_dir / f"subnet_{mode_name}_{ts}.md"
-    csv_path = out_dir / f"subnet_{mode_name}_{ts}.csv"
-
-    lines: list[str] = [
-        f"# Subnetting-Export ({mode_name})",
-        "",
-        f"- Datum/Zeit: {datetime.now().isoformat(timespec='seconds')}",
-        f"- Ausgangsnetz: `{base}`",
-        "",
-        "## Didaktische Kurz-Zusammenfassung",
-        "- Vorgehen: Ziel klären -> Präfix berechnen -> Magic Number -> Subnetze prüfen.",
-        "- Prüfen: Netzwerkadresse, Broadcast, Hostbereich und nutzbare Hosts.",
-        "",
-        "| Subnetz | Netz | Broadcast | First Host | Last Host | Nutzbare Hosts | Gesamtadressen | Maske | Wildcard | Magic |",
-        "|---|---|---|---|---|---:|---:|---|---|---:|",
-    ]
+    with md_path.open("w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as md_f, \
+            csv_path.open("w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as csv_f:
+        md_f.write(_md_header(base, mode_name))
+        csv.writer(csv_f, delimiter=";").writerow(CSV_HEADER)
+        while chunk := list(itertools.islice(infos, EXPORT_CHUNK_SIZE)):
+            _write_md_rows(md_f, chunk)
+            _write_csv_rows(csv_f, chunk)
 
-    for x in infos:
-        lines.append(
-            f"| `{x.subnet}` | `{x.network}` | `{x.broadcast}` | `{x.first_host}` | `{x.last_host}` | {x.usable_hosts} | {x.total_addresses} | `{x.netmask}` | `{x.wildcard}` | {x.magic_number} |"
-        )
+    ui.success(f"✔ Exportiert:\n  MD : {md_path}\n  CSV: {csv_path}")
+    return md_path, csv_path
 
-    md_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f, delimiter=";")
-        w.writerow([
-            "Subnetz", "Netzwerk", "Broadcast", "Erster Host", "Letzter Host", "Nutzbare Hosts",
-            "Gesamtadressen", "Maske", "Wildcard", "Magic Number", "Interessantes Oktett", "Host Bits", "Borrowed Bits"
-        ])
-        for x in infos:
-            w.writerow([
-                x.subnet, x.network, x.broadcast, x.first_host, x.last_host, x.usable_hosts,
-                x.total_addresses, x.netmask, x.wildcard, x.magic_number, x.interesting_octet, x.host_bits, x.borrowed_bits
-            ])
+def _export_chunk(start_int: int, count: int, prefix: int, borrowed_bits: int) -> tuple[str, str]:
+    """Formatiert einen Block aufeinanderfolgender Subnetze (läuft im Worker-Prozess)."""
+    block = 1 << (32 - prefix)
+    infos = [SubnetInfo(start_int + i * block, prefix, borrowed_bits) for i in range(count)]
+    md_buf = io.StringIO()
+    csv_buf = io.StringIO()
+    _write_md_rows(md_buf, infos)
+    _write_csv_rows(csv_buf, infos)
+    return md_buf.getvalue(), csv_buf.getvalue()
+
+
+def export_markdown_and_csv_parallel(
+    ui: UI,
+    base: ipaddress.IPv4Network,
+    mode_name: str,
+    new_prefix: int,
+    borrowed_bits: int,
+    out_dir: Path | None = None,
+) -> tuple[Path, Path]:
+    """Wie export_markdown_and_csv, verteilt die Formatierung aber auf mehrere Prozesse."""
+    base_int = int(base.network_address)
+    if (os.cpu_count() or 1) < 2:
+        infos = describe_subnets_bulk(base_int, base.prefixlen, new_prefix, borrowed_bits)
+        return export_markdown_and_csv(ui, base, mode_name, infos, out_dir)
+
+    md_path, csv_path = _export_paths(mode_name, out_dir)
+    total = 1 << (new_prefix - base.prefixlen)
+    block = 1 << (32 - new_prefix)
+    offsets = range(0, total, EXPORT_CHUNK_SIZE)
+
+    with md_path.open("w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as md_f, \
+            csv_path.open("w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as csv_f, \
+            ProcessPoolExecutor() as pool:
+        md_f.write(_md_header(base, mode_name))
+        csv.writer(csv_f, delimiter=";").writerow(CSV_HEADER)
+        chunks = pool.map(
+            _export_chunk,
+            [base_int + off * block for off in offsets],
+            [min(EXPORT_CHUNK_SIZE, total - off) for off in offsets],
+            itertools.repeat(new_prefix),
+            itertools.repeat(borrowed_bits),
+        )
+        for md_part, csv_part in chunks:
+            md_f.write(md_part)
+            csv_f.write(csv_part)
 
     ui.success(f"✔ Exportiert:\n  MD : {md_path}\n  CSV: {csv_path}")
     return md_path, csv_path
 
 
+def export_subnets(
+    ui: UI,
+    base: ipaddress.IPv4Network,
+    mode_name: str,
+    new_prefix: int,
+    borrowed_bits: int,
+) -> tuple[Path, Path]:
+    if ui.parallel and (1 << borrowed_bits) > PARALLEL_EXPORT_MIN:
+        return export_markdown_and_csv_parallel(ui, base, mode_name, new_prefix, borrowed_bits)
+    infos = describe_subnets_bulk(int(base.network_address), base.prefixlen, new_prefix, borrowed_bits)
+    return export_markdown_and_csv(ui, base, mode_name, infos)
+
+
 def action_split_by_n(ui: UI) -> None:
     ui.headline("1) Netzwerk in N Subnetze aufteilen (Lerne: Mechanismus!)")
     
@@ -870,9 +1034,10 @@ def action_split_by_n(ui: UI) -> None:
         ]
     )
 
-    base = ask_net(ui, "Ausgangsnetz (z.B. 192.168.1.0/24): ")
-    if base is None:
+    parsed = ask_net(ui, "Ausgangsnetz (z.B. 192.168.1.0/24): ")
+    if parsed is None:
         return
+    base, base_int = parsed
     
     ui.info(f"\n📌 Dein Netz: {base}")
     ui.info(f"   Präfix: /{base.prefixlen}")
@@ -894,8 +1059,10 @@ def action_split_by_n(ui: UI) -> None:
         ]
     )
 
-    borrowed_bits = math.ceil(math.log2(n)) if n > 1 else 0
+    borrowed_bits = (n - 1).bit_length()
     new_prefix = base.prefixlen + borrowed_bits
+    if new_prefix > 32:
+        raise ValueError("Zu viele Subnetze: Präfix würde > /32 werden.")
 
     ui.tutor_box(
         "🧮 Schritt 2: Die Formel",
@@ -951,14 +1118,16 @@ def action_split_by_n(ui: UI) -> None:
         ]
     )
 
-    infos = [describe_subnet(s, borrowed_bits=borrowed_bits) for s in list(base.subnets(new_prefix=new_prefix))]
+    num_subnets = 1 << borrowed_bits
     
-    ui.headline(f"Ergebnis: {len(infos)} Subnetze")
+    ui.headline(f"Ergebnis: {num_subnets} Subnetze")
     ui.info("")
-    print_subnets(ui, infos, limit=16)
+    print_subnets(
+        ui, describe_subnets_bulk(base_int, base.prefixlen, new_prefix, borrowed_bits), limit=16, total=num_subnets
+    )
     
-    if len(infos) > 16:
-        ui.warn(f"\n(Gezeigt: 16 von {len(infos)} Subnetzen)")
+    if num_subnets > 16:
+        ui.warn(f"\n(Gezeigt: 16 von {num_subnets} Subnetzen)")
 
     ui.tutor_box(
         "📝 Zusammenfassung - Merke dir das!",
@@ -978,7 +1147,7 @@ def action_split_by_n(ui: UI) -> None:
     if yes_no("\nNochmal üben mit anderen Werten? (j/n): "):
         action_split_by_n(ui)
     elif yes_no("Exportieren (MD+CSV)? (j/n): "):
-        export_markdown_and_csv(ui, base, "by_count", infos)
+        export_subnets(ui, base, "by_count", new_prefix, borrowed_bits)
 
 
 def action_split_by_prefix(ui: UI) -> None:
@@ -1002,9 +1171,10 @@ def action_split_by_prefix(ui: UI) -> None:
         ]
     )
 
-    base = ask_net(ui, "Ausgangsnetz (z.B. 10.0.0.0/16): ")
-    if base is None:
+    parsed = ask_net(ui, "Ausgangsnetz (z.B. 10.0.0.0/16): ")
+    if parsed is None:
         return
+    base, base_int = parsed
     
     ui.info(f"\n📌 Dein Netz: {base}")
     ui.info(f"   Aktuell: /{base.prefixlen} = {mask_from_prefix(base.prefixlen)}")
@@ -1018,7 +1188,7 @@ def action_split_by_prefix(ui: UI) -> None:
         return
 
     borrowed_bits = new_prefix - base.prefixlen
-    subs = list(base.subnets(new_prefix=new_prefix))
+    num_subnets = 1 << borrowed_bits
 
     ui.tutor_box(
         "🧮 Schritt 1: Berechne geborgte Bits",
@@ -1027,7 +1197,7 @@ def action_split_by_prefix(ui: UI) -> None:
             f"        = /{new_prefix} - /{base.prefixlen}",
             f"        = {borrowed_bits}",
             "",
-            f"Anzahl neuer Subnetze: 2^{borrowed_bits} = {len(subs)}",
+            f"Anzahl neuer Subnetze: 2^{borrowed_bits} = {num_subnets}",
         ]
     )
 
@@ -1067,25 +1237,26 @@ def action_split_by_prefix(ui: UI) -> None:
             f"✅ Ausgangsnetz: {base}",
             f"✅ Ziel-Präfix: /{new_prefix}",
             f"✅ Geborgte Bits: {borrowed_bits}",
-            f"✅ Neue Subnetze: {len(subs)}",
+            f"✅ Neue Subnetze: {num_subnets}",
             f"✅ Hosts pro Subnetz: {2**(32-new_prefix)-2}",
             f"✅ Magic Number: {magic}",
         ]
     )
 
-    infos = [describe_subnet(s, borrowed_bits=borrowed_bits) for s in subs]
     
-    ui.headline(f"Ergebnis: {len(infos)} Subnetze")
+    ui.headline(f"Ergebnis: {num_subnets} Subnetze")
     ui.info("")
-    print_subnets(ui, infos, limit=16)
+    print_subnets(
+        ui, describe_subnets_bulk(base_int, base.prefixlen, new_prefix, borrowed_bits), limit=16, total=num_subnets
+    )
     
-    if len(infos) > 16:
-        ui.warn(f"\n(Gezeigt: 16 von {len(infos)} Subnetzen)")
+    if num_subnets > 16:
+        ui.warn(f"\n(Gezeigt: 16 von {num_subnets} Subnetzen)")
 
     if yes_no("\nNochmal üben? (j/n): "):
         action_split_by_prefix(ui)
     elif yes_no("Exportieren (MD+CSV)? (j/n): "):
-        export_markdown_and_csv(ui, base, "by_prefix", infos)
+        export_subnets(ui, base, "by_prefix", new_prefix, borrowed_bits)
 
 
 def action_split_by_hosts(ui: UI) -> None:
@@ -1109,9 +1280,10 @@ def action_split_by_hosts(ui: UI) -> None:
         ]
     )
 
-    base = ask_net(ui, "Ausgangsnetz (z.B. 172.16.0.0/20): ")
-    if base is None:
+    parsed = ask_net(ui, "Ausgangsnetz (z.B. 172.16.0.0/20): ")
+    if parsed is None:
         return
+    base, base_int = parsed
     
     ui.info(f"\n📌 Dein Netz: {base}")
     ui.info(f"   Maximale Hosts: {2**(32-base.prefixlen)-2}")
@@ -1120,10 +1292,9 @@ def action_split_by_hosts(ui: UI) -> None:
     if hosts is None:
         return
 
-    host_bits = math.ceil(math.log2(hosts + 2))
+    host_bits = (hosts + 1).bit_length()
     new_prefix = 32 - host_bits
     borrowed_bits = new_prefix - base.prefixlen
-    subs = list(base.subnets(new_prefix=new_prefix))
 
     ui.tutor_box(
         "🧮 Schritt 1: Berechne benötigte Host-Bits",
@@ -1160,13 +1331,15 @@ def action_split_by_hosts(ui: UI) -> None:
         ui.error(f"   Maximum in {base}: {2**(32-base.prefixlen)-2} Hosts")
         return
 
+    num_subnets = 1 << borrowed_bits
+
     ui.tutor_box(
         "🧮 Schritt 3: Geborgte Bits & Subnetze",
         [
             f"Du borgst: {borrowed_bits} Bits von den Hosts",
             f"→ von /{base.prefixlen} auf /{new_prefix}",
             "",
-            f"Anzahl Subnetze: 2^{borrowed_bits} = {len(subs)}",
+            f"Anzahl Subnetze: 2^{borrowed_bits} = {num_subnets}",
         ]
     )
 
@@ -1190,23 +1363,24 @@ def action_split_by_hosts(ui: UI) -> None:
             f"✅ Host-Bits: {host_bits}",
             f"✅ Neues Präfix: /{new_prefix}",
             f"✅ Nutzbare Hosts: {2**(32-new_prefix)-2}",
-            f"✅ Neue Subnetze: {len(subs)}",
+            f"✅ Neue Subnetze: {num_subnets}",
         ]
     )
 
-    infos = [describe_subnet(s, borrowed_bits=borrowed_bits) for s in subs]
     
-    ui.headline(f"Ergebnis: {len(infos)} Subnetze mit je {2**(32-new_prefix)-2} Hosts")
+    ui.headline(f"Ergebnis: {num_subnets} Subnetze mit je {2**(32-new_prefix)-2} Hosts")
     ui.info("")
-    print_subnets(ui, infos, limit=16)
+    print_subnets(
+        ui, describe_subnets_bulk(base_int, base.prefixlen, new_prefix, borrowed_bits), limit=16, total=num_subnets
+    )
     
-    if len(infos) > 16:
-        ui.warn(f"\n(Gezeigt: 16 von {len(infos)} Subnetzen)")
+    if num_subnets > 16:
+        ui.warn(f"\n(Gezeigt: 16 von {num_subnets} Subnetzen)")
 
     if yes_no("\nNochmal üben? (j/n): "):
         action_split_by_hosts(ui)
     elif yes_no("Exportieren (MD+CSV)? (j/n): "):
-        export_markdown_and_csv(ui, base, "by_hosts", infos)
+        export_subnets(ui, base, "by_hosts", new_prefix, borrowed_bits)
 
 
 def action_ip_in_subnet(ui: UI) -> None:
@@ -1229,9 +1403,10 @@ def action_ip_in_subnet(ui: UI) -> None:
         ]
     )
 
-    base = ask_net(ui, "Ausgangsnetz (z.B. 192.168.1.0/24): ")
-    if base is None:
+    parsed = ask_net(ui, "Ausgangsnetz (z.B. 192.168.1.0/24): ")
+    if parsed is None:
         return
+    base, base_int = parsed
     
     target_prefix = ask_int(ui, "Ziel-Präfix (z.B. 27): ", min_v=0, max_v=32)
     if target_prefix is None:
@@ -1241,9 +1416,13 @@ def action_ip_in_subnet(ui: UI) -> None:
         ui.error(f"Ziel-Präfix /{target_prefix} muss >= /{base.prefixlen} sein.")
         return
 
-    ip = ask_ip(ui, "IP-Adresse (z.B. 192.168.1.130): ")
-    if ip is None:
+    parsed_ip = ask_ip(ui, "IP-Adresse (z.B. 192.168.1.130): ")
+    if parsed_ip is None:
         return
+    ip, ip_int = parsed_ip
+
+    target_mask = mask_int_from_prefix(target_prefix)
+    hit_net_int = ip_int & target_mask
 
     ui.tutor_box(
         "🧮 Schritt 1: Berechne Netzwerk-Adresse",
@@ -1255,18 +1434,15 @@ def action_ip_in_subnet(ui: UI) -> None:
             f"IP binary:      {ip_to_binary(str(ip))}",
             f"Maske binary:   {mask_to_binary(mask_from_prefix(target_prefix))}",
             "─────────────────────────",
-            f"Netzwerk:       {ip_to_binary(str(ipaddress.IPv4Network(f'{ip}/{target_prefix}', strict=False).network_address))}",
+            f"Netzwerk:       {ip_to_binary(int_to_ip(hit_net_int))}",
         ]
     )
 
-    subs = list(base.subnets(new_prefix=target_prefix))
-    hit = next((s for s in subs if ip in s), None)
-
-    if hit is None:
+    if ip_int & mask_int_from_prefix(base.prefixlen) != base_int:
         ui.error(f"❌ IP {ip} liegt NICHT im Netz {base}!")
         return
 
-    info = describe_subnet(hit, borrowed_bits=target_prefix - base.prefixlen)
+    info = describe_subnet_from_ints(hit_net_int, target_prefix, borrowed_bits=target_prefix - base.prefixlen)
 
     ui.tutor_box(
         "🧮 Schritt 2: Ergebnis",
@@ -1321,11 +1497,12 @@ def action_analyze_network(ui: UI) -> None:
         ]
     )
 
-    net = ask_net(ui, "Netzwerk (z.B. 192.168.1.0/27): ")
-    if net is None:
+    parsed = ask_net(ui, "Netzwerk (z.B. 192.168.1.0/27): ")
+    if parsed is None:
         return
+    net, net_int = parsed
 
-    info = describe_subnet(net)
+    info = describe_subnet_from_ints(net_int, net.prefixlen)
 
     ui.tutor_box(
         "📊 Grunddaten",
@@ -1404,13 +1581,13 @@ def run_action_safely(ui: UI, action: callable) -> None:
 
 
 
-def parse_args(argv: list[str]) -> bool:
-    return "--no-color" not in argv
+def parse_args(argv: list[str]) -> tuple[bool, bool]:
+    return "--no-color" not in argv, "--parallel" in argv
 
 
 def main() -> None:
-    use_color = parse_args(sys.argv[1:])
-    ui = UI(use_color=use_color)
+    use_color, parallel = parse_args(sys.argv[1:])
+    ui = UI(use_color=use_color, parallel=parallel)
 
     ui.headline("IPv4 Subnetting Tutor – LPIC / IHK / CompTIA")
     ui.info("Hinweis: Farben aus = starte mit: python3 subnetear.py --no-color")